@@ -72,142 +72,161 @@ Usage:
         [number][metric prefix][unit]
         [number][unit]
     Numbers may be integers or floats.
-    Accepted prefixes are p, n, u, m, k, M. Case-sensitive.
+    Accepted prefixes are p, n, u (or μ), m, k, M. Case-sensitive.
     Accepted units are o, ohms, f, farads, hz, hertz. Not case-sensitive.
     Designed to ignore whitespace.
     Not designed for high precision!
 
+    Importing for sweeps/tables:
+        sweep_freq(resistances, capacitances) returns an array of -3dB
+        frequencies, handy for plotting. Needs numpy, uses numba if present.
+
 """
 
-from math import pi
+from math import floor, log10, pi
+import re
 import sys
 
+_INV_TWO_PI = 1/(2*pi)
+
 
 def get_frequency(resistance, capacitance):
     """ Provided resistance and capacitance, return frequency
     """
-    f = 1/(2*pi*resistance*capacitance)  # pylint: disable=C0103
+    f = _INV_TWO_PI/(resistance*capacitance)  # pylint: disable=C0103
     return f
 
 
 def get_component(frequency, component):
     """ Provided frequency and either component value, return remaining value
     """
-    x = (1/frequency)/(2*pi*component)  # pylint: disable=C0103
+    x = _INV_TWO_PI/(frequency*component)  # pylint: disable=C0103
     return x
 
 
-def sig_fig(value):
-    """ Returns int or float x formatted to 3 significant figures """
-    if isinstance(value, str):
-        try:
-            value = float(value)
-        except ValueError:
-            print('Input not recognized.')
-    x = f'{float(f"{value:.3g}"):g}'  # pylint: disable=C0103
-    x = float(x)  # pylint: disable=C0103
-    # unnecessary typing, perhaps
-    if int(x) == x:
-        x = int(x)  # pylint: disable=C0103
-    return x
+# numba-compiled sweep_freq kernel, False once numba is known to be missing
+_SWEEP_FREQ_KERNEL = None
 
 
-def input_tidy(value):
-    """ Ensures arguments fit expected formatting
-    No whitespace, all lowercase except M
-    Shortens written units
+def _sweep_freq_kernel():
+    """ Compile the per-element sweep_freq loop with numba on first use
+    Returns None if numba is not installed
     """
-    x = ''  # pylint: disable=C0103
-    # originally had .lower before the split, but causes issues with M/mega
-    # then found that without lower, Hz would give unexpected results
-    # so I had to finger it out
-    x = ''.join(value.split())  # pylint: disable=C0103
-    if x.find('M') != x.lower().find('M'):
-        mega = x.find('M')
-        x = list(x.lower())  # pylint: disable=C0103
-        x[mega] = 'M'
-        x = ''.join(x)  # pylint: disable=C0103
-    else:
-        x = x.lower()  # pylint: disable=C0103
-    if isinstance(value, str) and len(value) >= 2:
-        if x.find('o') != -1:
-            x = x[:x.find('o')+1]  # pylint: disable=C0103
-        elif x.find('h') != -1:
-            x = x[:x.find('h')+1]+'z'  # pylint: disable=C0103
-        elif x.find('f') != -1:
-            x = x[:x.find('f')+1]  # pylint: disable=C0103
+    global _SWEEP_FREQ_KERNEL  # pylint: disable=W0603
+    if _SWEEP_FREQ_KERNEL is None:
+        try:
+            from numba import njit, prange  # pylint: disable=C0415
+        except ImportError:
+            _SWEEP_FREQ_KERNEL = False
         else:
-            raise ValueError(f'Unit not recognized in argument {value}.')
-    else:
-        raise Exception(f'Invalid argument {value}: missing units.')
-    return x
-
-
-def get_unit(value):
-    """ Determine unit
+            @njit(parallel=True, fastmath=True)
+            def kernel(resistance, capacitance, out):
+                for i in prange(resistance.shape[0]):
+                    out[i] = _INV_TWO_PI/(resistance[i]*capacitance[i])
+            _SWEEP_FREQ_KERNEL = kernel
+    return _SWEEP_FREQ_KERNEL or None
+
+
+def sweep_freq(resistances, capacitances):
+    """ Vectorized get_frequency for sweeps and tables
+
+    input: array-likes of resistance and capacitance, broadcast together
+    output: ndarray of -3dB frequencies
+    Requires numpy, uses numba if it is installed
+    numpy and numba are only imported here, so the calculator itself
+    sticks to the stdlib
     """
-    unit = {
-        'h': 'frequency',
-        'z': 'frequency',
-        'o': 'resistance',
-        'f': 'capacitance'
-        }
-    x = ''  # pylint: disable=C0103
-
-    if value[-1].isalpha():
-        try:
-            x = unit[value[-1]]  # pylint: disable=C0103
-        except KeyError:
-            print('Unrecognized unit.')
-    elif value[-1].isnumeric():
-        print('Value passed lacks unit.')
-
-    return x
+    try:
+        import numpy as np  # pylint: disable=C0415
+    except ImportError as err:
+        raise ImportError('sweep_freq requires numpy.') from err
+    resistances, capacitances = np.broadcast_arrays(
+        np.asarray(resistances, dtype=float),
+        np.asarray(capacitances, dtype=float))
+    kernel = _sweep_freq_kernel()
+    if kernel is None:
+        return _INV_TWO_PI/(resistances*capacitances)
+    out = np.empty(resistances.shape)
+    kernel(np.ascontiguousarray(resistances).ravel(),
+           np.ascontiguousarray(capacitances).ravel(),
+           out.reshape(-1))
+    return out
 
 
-def strip_unit(value):
-    """ Remove unit
-    """
-    x = ''  # pylint: disable=C0103
+def sig_fig(value):
+    """ Returns int or float x rounded to 3 significant figures """
+    x = float(value)  # pylint: disable=C0103
+    if x == 0:
+        return 0
+    x = round(x, 2 - floor(log10(abs(x))))  # pylint: disable=C0103
+    # unnecessary typing, perhaps
+    if int(x) == x:
+        x = int(x)  # pylint: disable=C0103
+    return x
 
-    if value[-1].isalpha():
-        if value[-2] == 'h' and value[-1] == 'z':
-            x = value[:-2]  # pylint: disable=C0103
-        elif value[-1] == 'f' or value[-1] == 'o':
-            x = value[:-1]  # pylint: disable=C0103
-        else:
-            print('Value lacks unit.')
-    elif value[-1].isnumeric():
-        print('Value passed lacks unit and prefix.')
 
-    return x
+# [number][metric prefix][unit], whitespace allowed in between
+# Prefix is case-sensitive so M (mega) and m (milli) stay apart, unit is not
+# Both the mu and micro sign characters are accepted for micro
+_ARG_RE = re.compile(
+    r'^\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+))'
+    r'\s*([pPnNuU\u03bc\u00b5mMkK]?)'
+    r'\s*(?i:(ohms?|o|hz|hertz|f|farads?))\s*$'
+)
 
 
-def strip_prefix(value):
-    """ Remove metric prefix and return plain number
+def _ascii_table(entries, both_cases=True):
+    """ Build a 128-entry list indexed by ord() of each key character
+    Characters not in entries map to None
     """
-    x = ''  # pylint: disable=C0103
-    prefix = {
-        'p': 1e-12,  # pico
-        'n': 1e-9,   # nano
-        'u': 1e-6,   # micro
-        # '\u03bc': 1e-6,  # actual mu character
-        'm': 1e-3,   # milli
-        # '': 1,       # uhh what's the term for this
-        'k': 1e3,    # kilo
-        'M': 1e6,    # mega
-        }
-    try:
-        x = float(value[:-1]) * prefix[value[-1]]  # pylint: disable=C0103
-    except KeyError:
-        # if value passed is a number
-        try:
-            if isinstance(int(value[-1]), int):
-                x = value  # pylint: disable=C0103
-        except ValueError:
-            print('Error: unable to parse value.')
-    x = float(x)  # pylint: disable=C0103
-    return x
+    table = [None]*128
+    for ch, item in entries:
+        table[ord(ch)] = item
+        if both_cases:
+            table[ord(ch.upper())] = item
+    return table
+
+
+# Prefix multipliers and unit kinds, indexed by ord() of the prefix character
+# and of the unit's first letter
+# m and M are kept apart, so prefixes are entered in both cases by hand
+_PREFIX_MUL = _ascii_table((('p', 1e-12), ('P', 1e-12),  # pico
+                            ('n', 1e-9), ('N', 1e-9),     # nano
+                            ('u', 1e-6), ('U', 1e-6),     # micro
+                            ('m', 1e-3),                  # milli
+                            ('k', 1e3), ('K', 1e3),       # kilo
+                            ('M', 1e6)),                  # mega
+                           both_cases=False)
+_UNIT_KIND = _ascii_table((('h', 'frequency'),
+                           ('o', 'resistance'),
+                           ('f', 'capacitance')))
+
+
+def parse_arg(value):
+    """ Parse an argument into the quantity it specifies and its plain value
+
+    input: string such as '4.7 kohm', '10nF' or '20kHz'
+    returns: (unit_kind, float_value)
+    """
+    match = _ARG_RE.match(value)
+    if match is None:
+        raise ValueError(f'Unable to parse argument {value}.')
+    number, prefix, unit = match.groups()
+    mul = 1.0
+    if prefix:
+        code = ord(prefix)
+        if code >= 128:
+            # mu or micro sign
+            code = ord('u')
+        mul = _PREFIX_MUL[code]
+        if mul is None:
+            raise ValueError(f'Unknown prefix {prefix} in argument {value}.')
+    return _UNIT_KIND[ord(unit[0])], float(number) * mul
+
+
+# Metric prefixes and their powers of ten, from 1e-12 up to 1e6 in steps of 3
+_PREFIX_SYMBOL = ('p', 'n', 'u', 'm', '', 'k', 'M')
+_POW10 = (1e-12, 1e-9, 1e-6, 1e-3, 1, 1e3, 1e6)
 
 
 def add_prefix(value):
@@ -216,47 +235,13 @@ def add_prefix(value):
     input: plain number
     output: string of number followed by prefix
     """
-    prefix = {
-        -12: 'p',
-        -9: 'n',
-        -6: 'u',
-        -3: 'm',
-        3: 'k',
-        6: 'M'
-    }
-    exponent = 1
-    num = value
-    try:
-        num = float(num)
-    except ValueError:
-        print('Not a number!')
-    if num > 1:
-        for i in range(3, 7, 3):
-            # print(i, 10**i)
-            # print(num / 10**i)
-            if 1000 > (num / 10**i) > 1:
-                exponent = i
-                break
-    elif num < 1:
-        for i in range(-12, -2, 3):
-            # print(i, 10**i)
-            # print(num / 10**i)
-            if 1000 > (num / 10**i) > 1:
-                exponent = i
-                break
-
-    if num == int(num):
-        num = int(num)
-
-    if exponent != 1:
-        num = str(sig_fig(num / 10 ** exponent))
-        try:
-            exponent = prefix[exponent]
-            return num + exponent
-        except KeyError:
-            print('Gadzooks!')
-    else:
-        return str(num)
+    num = float(value)
+    if num == 0:
+        return '0'
+    exponent = 3 * (floor(log10(abs(num))) // 3)
+    exponent = max(-12, min(6, exponent))
+    index = (exponent + 12) // 3
+    return f'{sig_fig(num / _POW10[index])}{_PREFIX_SYMBOL[index]}'
 
 
 def float_to_string(value):
@@ -270,18 +255,33 @@ def float_to_string(value):
     return ('%.20f' % value).rstrip('0').rstrip('.')
 
 
+# Missing value -> (solver taking the values dict, output format string)
+SOLVERS = {
+    'frequency': (
+        lambda v: get_frequency(v['resistance'], v['capacitance']),
+        'The filter\'s -3dB frequency is {}Hz.'),
+    'resistance': (
+        lambda v: get_component(v['frequency'], v['capacitance']),
+        'You will need a {}ohm resistor.'),
+    'capacitance': (
+        lambda v: get_component(v['frequency'], v['resistance']),
+        'You will need a {}F capacitor.'),
+}
+
+
 def main():
     """ Main block
 
     Attributes:
-    frc : list[bool, bool, bool]
-        Frequency, resistance, capacitance. Tracks which values are known.
+    values : dict[str, float | None]
+        Frequency, resistance, capacitance. None until the value is known,
+        the one left as None is solved for using SOLVERS.
 
     """
     values = {
-        'frequency': '',
-        'resistance': '',
-        'capacitance': '',
+        'frequency': None,
+        'resistance': None,
+        'capacitance': None,
     }
     input_args = sys.argv[1:]
 
@@ -292,29 +292,22 @@ def main():
         sys.exit()
 
     for i in input_args[0:]:
-        tidy_arg = input_tidy(i)
+        kind, value = parse_arg(i)
         if len(sys.argv[0]) < 1:
             print(f'Raw Argument: {i}\n'
-                  f'Formatted Argument: {tidy_arg}\n'
-                  f'Argument specifies {get_unit(tidy_arg)}\n'
-                  f'Base number: {strip_prefix(strip_unit(tidy_arg))}\n'
-                  f'3 sigfigs: {sig_fig(strip_prefix(strip_unit(tidy_arg)))}'
+                  f'Argument specifies {kind}\n'
+                  f'Base number: {value}\n'
+                  f'3 sigfigs: {sig_fig(value)}'
                   '')
-        values[get_unit(tidy_arg)] = sig_fig(
-                                        strip_prefix(strip_unit(tidy_arg)))
-        # print(values[get_unit(tidy_arg)])
-
-    if values['frequency'] == '':
-        frq = get_frequency(values['resistance'], values['capacitance'])
-        print('The filter\'s -3dB frequency is '
-              f'{add_prefix(sig_fig(frq))}Hz.')
-    elif values['resistance'] == '':
-        res = get_component(values['frequency'], values['capacitance'])
-        print(f'You will need a {add_prefix(sig_fig(res))}ohm resistor.')
-    elif values['capacitance'] == '':
-        cap = get_component(values['frequency'], values['resistance'])
-        print(f'You will need a '
-              f'{add_prefix(sig_fig(cap))}F capacitor.')
+        values[kind] = sig_fig(value)
+
+    missing = [k for k, v in values.items() if v is None]
+    if len(missing) != 1:
+        print('\nArguments must specify two different values.\n')
+        sys.exit()
+
+    solver, output = SOLVERS[missing[0]]
+    print(output.format(add_prefix(sig_fig(solver(values)))))
 
 
 if __name__ == '__main__':